@@ -7,6 +7,8 @@ for accomplishing complex web-based tasks.
 
 from .web_agent import WebAgent
 from .tools import WebTools
+from .session_store import SessionStore
+from .artifact_store import ArtifactStore
 from .config import *
 
 __version__ = "1.0.0"
@@ -16,6 +18,8 @@ __description__ = "Web automation agent with OpenAI function calling"
 __all__ = [
     "WebAgent",
     "WebTools",
+    "SessionStore",
+    "ArtifactStore",
     "OPENAI_API_KEY",
     "OPENAI_MODEL",
     "BROWSER_MODEL",
@@ -0,0 +1,137 @@
+"""
+Artifact store module for Browser-Use Agent
+
+Spills large browser artifacts (screenshots, step histories) to a
+content-addressed directory on disk with size-bounded LRU eviction, so that
+in-memory results only need to hold short references.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional
+from config import ARTIFACT_DIR, ARTIFACT_STORE_MAX_BYTES
+
+
+class ArtifactStore:
+    """Content-addressed on-disk store with least-recently-used eviction"""
+
+    def __init__(self, artifact_dir: str = ARTIFACT_DIR, max_bytes: int = ARTIFACT_STORE_MAX_BYTES):
+        os.makedirs(artifact_dir, exist_ok=True)
+
+        self.artifact_dir = artifact_dir
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # Artifact name -> size in bytes, ordered from least to most recently used
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU index from files already on disk, oldest access first"""
+        entries = []
+        with os.scandir(self.artifact_dir) as scan:
+            for entry in scan:
+                if entry.name.endswith(".tmp"):
+                    # Left behind by a put() that crashed before its rename
+                    os.remove(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self.total_bytes += size
+        self._evict()
+
+    def put(self, data: bytes, extension: str = "bin") -> Optional[str]:
+        """
+        Store an artifact, deduplicating by content hash
+
+        Args:
+            data: Raw artifact bytes
+            extension: File extension describing the content (e.g. 'png', 'json')
+
+        Returns:
+            Reference to the stored artifact (its file name), or None if it exceeds the store's size budget
+        """
+        if len(data) > self.max_bytes:
+            return None
+
+        name = f"{hashlib.sha256(data).hexdigest()}.{extension}"
+        path = os.path.join(self.artifact_dir, name)
+
+        if name in self._index:
+            if os.path.exists(path):
+                self._touch(name)
+                return name
+            # Deleted behind our back (e.g. by another process sharing the directory); write it again
+            self._forget(name)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        self._index[name] = len(data)
+        self.total_bytes += len(data)
+        self._evict()
+        return name
+
+    def get(self, reference: str) -> Optional[bytes]:
+        """
+        Read an artifact back from disk
+
+        Args:
+            reference: Reference returned by put()
+
+        Returns:
+            Artifact bytes, or None if it has been evicted or deleted
+        """
+        if reference not in self._index:
+            return None
+
+        try:
+            with open(os.path.join(self.artifact_dir, reference), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._forget(reference)
+            return None
+        self._touch(reference)
+        return data
+
+    def path(self, reference: str) -> str:
+        """Get the file path of an artifact"""
+        return os.path.join(self.artifact_dir, reference)
+
+    def _touch(self, name: str):
+        """Mark an artifact as most recently used"""
+        self._index.move_to_end(name)
+        try:
+            os.utime(os.path.join(self.artifact_dir, name))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, name: str):
+        """Drop an artifact whose file no longer exists from the index"""
+        self.total_bytes -= self._index.pop(name)
+
+    def _evict(self):
+        """Delete least recently used artifacts until the store fits its size budget"""
+        while self.total_bytes > self.max_bytes:
+            name, size = self._index.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(os.path.join(self.artifact_dir, name))
+            except FileNotFoundError:
+                pass
+
+
+_default_store: Optional[ArtifactStore] = None
+
+
+def get_default_store() -> ArtifactStore:
+    """Get the artifact store shared by all tools in this process"""
+    global _default_store
+    if _default_store is None:
+        _default_store = ArtifactStore()
+    return _default_store
@@ -18,6 +18,16 @@ AGENT_DESCRIPTION = "Browser automation assistant"
 # Browser Configuration
 BROWSER_MODEL = "gpt-4.1"
 
+# Session Store Configuration
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "tmp/sessions.db")
+SESSION_HISTORY_WINDOW = 20  # Messages kept in memory per session
+SESSION_SUMMARY_MAX_ITEMS = 10  # Earlier user requests listed in the summary
+
+# Artifact Store Configuration
+ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "tmp/artifacts")
+ARTIFACT_STORE_MAX_BYTES = 500 * 1024 * 1024  # Disk budget before LRU eviction
+ARTIFACT_INLINE_MAX_CHARS = 2000  # Longer final results are truncated in tool results
+
 # UI Messages
 WELCOME_MESSAGE = """🤖 Web Agent Started!
 I can help you with web-based tasks like searching, shopping, booking, and more.
@@ -26,7 +36,11 @@ Type 'quit' or 'exit' to stop.
 
 GOODBYE_MESSAGE = "👋 Goodbye!"
 
+NEW_SESSION_MESSAGE = "💾 New session {0} (run `python main.py {0}` to resume)\n"
+RESUMED_SESSION_MESSAGE = "💾 Resumed session {} ({} messages)\n"
+
 # Error Messages
 ERROR_NO_API_KEY = "❌ Error: OPENAI_API_KEY not found in environment variables"
 ERROR_PROCESSING = "❌ Error processing request: {}"
-ERROR_WEB_TASK = "❌ Error executing web task: {}" 
\ No newline at end of file
+ERROR_WEB_TASK = "❌ Error executing web task: {}"
+ERROR_UNKNOWN_SESSION = "❌ Error: Unknown session ID: {}" 
\ No newline at end of file
@@ -5,14 +5,16 @@ Provides the interactive loop for user interaction.
 """
 
 import asyncio
+import sys
+from typing import Optional
 from web_agent import WebAgent
-from config import WELCOME_MESSAGE, GOODBYE_MESSAGE
+from config import WELCOME_MESSAGE, GOODBYE_MESSAGE, NEW_SESSION_MESSAGE, RESUMED_SESSION_MESSAGE
 from browser_use import BrowserSession
 from browser_use.browser import BrowserProfile
 
 
 
-async def run_agent_loop():
+async def run_agent_loop(session_id: Optional[str] = None):
     """Main agent loop for interacting with users"""
     print(WELCOME_MESSAGE)
     
@@ -27,7 +29,11 @@ async def run_agent_loop():
 
         browser_session = BrowserSession(browser_profile=main_profile)
         
-        agent = WebAgent(browser_session=browser_session)
+        agent = WebAgent(browser_session=browser_session, session_id=session_id)
+        if agent.resumed:
+            print(RESUMED_SESSION_MESSAGE.format(agent.session_id, agent.session_store.count_messages(agent.session_id)))
+        else:
+            print(NEW_SESSION_MESSAGE.format(agent.session_id))
     except ValueError as e:
         print(str(e))
         return
@@ -66,7 +72,8 @@ async def run_agent_loop():
 
 def main():
     """Main entry point"""
-    asyncio.run(run_agent_loop())
+    session_id = sys.argv[1] if len(sys.argv) > 1 else None
+    asyncio.run(run_agent_loop(session_id))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,181 @@
+"""
+Session store module for Browser-Use Agent
+
+Persists conversation messages to a local SQLite database (WAL mode) so that
+sessions survive restarts and only a recent window needs to stay in memory.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
+from config import SESSION_DB_PATH, SESSION_SUMMARY_MAX_ITEMS
+
+
+class SessionStore:
+    """Append-only message log backed by SQLite"""
+
+    def __init__(self, db_path: str = SESSION_DB_PATH):
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create the sessions and messages tables if they don't exist"""
+        with self.connection:
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )"""
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_session ON messages (session_id, id)"
+            )
+
+    def session_exists(self, session_id: str) -> bool:
+        """Check whether a session has been registered"""
+        return self.connection.execute(
+            "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone() is not None
+
+    def count_messages(self, session_id: str) -> int:
+        """Count the logged messages of a session"""
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,)
+        ).fetchone()[0]
+
+    def create_session(self, session_id: Optional[str] = None) -> str:
+        """
+        Register a session, generating a new ID if none is given
+
+        Args:
+            session_id: Existing session ID to register or resume
+
+        Returns:
+            The session ID
+        """
+        session_id = session_id or uuid.uuid4().hex
+        now = time.time()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO sessions (session_id, created_at, updated_at) VALUES (?, ?, ?)",
+                (session_id, now, now)
+            )
+        return session_id
+
+    def append_messages(self, session_id: str, messages: List[Dict[str, Any]]):
+        """
+        Append messages to a session's log in a single transaction
+
+        Args:
+            session_id: Session to append to
+            messages: Messages in OpenAI chat format
+        """
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO messages (session_id, role, payload, created_at) VALUES (?, ?, ?, ?)",
+                [(session_id, message["role"], json.dumps(message), now) for message in messages]
+            )
+            self.connection.execute(
+                "UPDATE sessions SET updated_at = ? WHERE session_id = ?",
+                (now, session_id)
+            )
+
+    def load_recent(self, session_id: str, window: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Load the most recent messages of a session plus a summary of older ones
+
+        Args:
+            session_id: Session to load
+            window: Maximum number of recent messages to load
+
+        Returns:
+            Tuple of (recent messages, summary of earlier messages or None)
+        """
+        rows = self.connection.execute(
+            "SELECT id, payload FROM messages WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+            (session_id, window)
+        ).fetchall()
+        rows.reverse()
+
+        # Never start the window on a tool result whose tool call was cut off
+        while rows and json.loads(rows[0][1])["role"] == "tool":
+            rows.pop(0)
+
+        messages = [json.loads(payload) for _, payload in rows]
+        first_id = rows[0][0] if rows else None
+        return messages, self._summarize_before(session_id, first_id)
+
+    def _summarize_before(self, session_id: str, before_id: Optional[int]) -> Optional[str]:
+        """
+        Build a compact summary of the messages preceding the loaded window
+
+        Args:
+            session_id: Session to summarize
+            before_id: Message ID where the loaded window starts (None if the window is empty)
+
+        Returns:
+            Summary text, or None if there are no earlier messages
+        """
+        if before_id is None:
+            before_id = self.connection.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM messages WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()[0]
+
+        earlier_count = self.connection.execute(
+            "SELECT COUNT(*) FROM messages WHERE session_id = ? AND id < ?",
+            (session_id, before_id)
+        ).fetchone()[0]
+        if not earlier_count:
+            return None
+
+        rows = self.connection.execute(
+            "SELECT payload FROM messages WHERE session_id = ? AND id < ? AND role = 'user' ORDER BY id DESC LIMIT ?",
+            (session_id, before_id, SESSION_SUMMARY_MAX_ITEMS)
+        ).fetchall()
+        user_requests = [json.loads(payload)["content"] for (payload,) in reversed(rows)]
+
+        return f"""Summary of {earlier_count} earlier messages in this session (not shown in full):
+Earlier user requests:
+{chr(10).join(f"   • {request[:200]}" for request in user_requests)}"""
+
+    def clear_session(self, session_id: str):
+        """Delete all logged messages for a session"""
+        with self.connection:
+            self.connection.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+
+_default_store: Optional[SessionStore] = None
+
+
+def get_default_store() -> SessionStore:
+    """Get the session store shared by all agents in this process"""
+    global _default_store
+    if _default_store is None:
+        _default_store = SessionStore()
+    return _default_store
@@ -0,0 +1,80 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Modules live at the repository root and import each other as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tools  # noqa: E402
+import web_agent  # noqa: E402
+from artifact_store import ArtifactStore  # noqa: E402
+from session_store import SessionStore  # noqa: E402
+
+
+class FakeOpenAI:
+    """Stand-in for openai.OpenAI that answers chat completions without network access"""
+
+    def __init__(self, reply="Done.", tool_call=None, error=None):
+        self.reply = reply
+        self.tool_call = tool_call
+        self.error = error
+        self.last_messages = None
+        self.chat = SimpleNamespace(completions=self)
+
+    def create(self, **kwargs):
+        self.last_messages = kwargs["messages"]
+        if self.error:
+            raise self.error
+
+        if self.tool_call and "tools" in kwargs:
+            name, arguments = self.tool_call
+            function = SimpleNamespace(name=name, arguments=arguments)
+            message = SimpleNamespace(content=None, tool_calls=[SimpleNamespace(id="call_1", function=function)])
+        else:
+            message = SimpleNamespace(content=self.reply, tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def session_store(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def artifact_store(tmp_path):
+    return ArtifactStore(str(tmp_path / "artifacts"), max_bytes=8 * 1024 * 1024)
+
+
+@pytest.fixture
+def make_agent(monkeypatch, session_store, artifact_store):
+    """Factory for WebAgents backed by temporary stores and a FakeOpenAI client"""
+    monkeypatch.setattr(web_agent, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(tools, "get_default_store", lambda: artifact_store)
+
+    def factory(session_id=None, **openai_kwargs):
+        agent = web_agent.WebAgent(session_id=session_id, session_store=session_store)
+        agent.openai_client = FakeOpenAI(**openai_kwargs)
+        return agent
+
+    return factory
+
+
+@pytest.fixture
+def stub_browser_run(monkeypatch):
+    """Replace browser_use.Agent in tools so that run() returns histories built by the given factory"""
+
+    def stub(make_history):
+        class FakeBrowserAgent:
+            def __init__(self, **kwargs):
+                pass
+
+            async def run(self):
+                return make_history()
+
+        monkeypatch.setattr(tools, "Agent", FakeBrowserAgent)
+
+    return stub
@@ -0,0 +1,157 @@
+import asyncio
+import base64
+import gc
+import json
+import os
+import tracemalloc
+
+from artifact_store import ArtifactStore
+from config import ARTIFACT_INLINE_MAX_CHARS
+from tools import WebTools
+
+SCREENSHOT_COUNT = 4
+
+
+class FakeHistory:
+    """Stand-in for browser-use's AgentHistoryList with large screenshots and step data"""
+
+    def __init__(self):
+        self._screenshots = [base64.b64encode(os.urandom(256 * 1024)).decode() for _ in range(SCREENSHOT_COUNT)]
+        self._steps = [{"step": i, "dom": os.urandom(4 * 1024).hex()} for i in range(50)]
+
+    def __repr__(self):
+        # Like pydantic's repr, the full step and screenshot payloads end up in the string
+        return f"FakeHistory(steps={self._steps!r}, screenshots={self._screenshots!r})"
+
+    __str__ = __repr__
+
+    def is_done(self):
+        return True
+
+    def is_successful(self):
+        return True
+
+    def final_result(self):
+        return "Order placed. " + "details " * 1000
+
+    def number_of_steps(self):
+        return len(self._steps)
+
+    def errors(self):
+        return [None] * len(self._steps)
+
+    def screenshots(self):
+        return self._screenshots
+
+    def model_dump(self):
+        return {"history": self._steps}
+
+
+def test_memory_stays_flat_across_100_tasks(make_agent, session_store, stub_browser_run):
+    stub_browser_run(FakeHistory)
+    arguments = json.dumps({"task_description": "Buy a book", "task_steps": ["Search", "Checkout"]})
+    agent = make_agent(tool_call=("execute_web_task", arguments), reply="Your book is ordered.")
+
+    async def run_tasks(count):
+        for _ in range(count):
+            await agent.process_user_input("Buy me a book")
+
+    # Warm up caches and lazy imports before measuring
+    asyncio.run(run_tasks(5))
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    asyncio.run(run_tasks(100))
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Each task produces ~1.8 MB of history; retaining any of it would blow far past this
+    assert growth < 1024 * 1024
+
+    tool_results = [
+        json.loads(payload)["content"]
+        for (payload,) in session_store.connection.execute(
+            "SELECT payload FROM messages WHERE session_id = ? AND role = 'tool'", (agent.session_id,)
+        )
+    ]
+    assert len(tool_results) == 105
+    for result in tool_results:
+        assert result.startswith("✅")
+        assert len(result) < ARTIFACT_INLINE_MAX_CHARS + 1000
+        assert ".json" in result
+
+
+def test_artifact_failure_does_not_fail_task(artifact_store, stub_browser_run, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(artifact_store, "put", fail)
+    stub_browser_run(FakeHistory)
+
+    result = asyncio.run(WebTools(artifact_store=artifact_store).execute_web_task("Buy a book", ["Search"]))
+    assert result.startswith("✅")
+    assert "Order placed." in result
+    assert "Artifacts: not saved" in result
+
+
+def test_artifacts_over_budget_are_not_reported_as_saved(tmp_path, stub_browser_run):
+    # Smaller than both the step history and a single screenshot
+    store = ArtifactStore(str(tmp_path), max_bytes=100 * 1024)
+    stub_browser_run(FakeHistory)
+
+    result = asyncio.run(WebTools(artifact_store=store).execute_web_task("Buy a book", ["Search"]))
+    assert "history not saved" in result
+    assert "None" not in result
+    assert ".json" not in result and ".png" not in result
+    assert f"{SCREENSHOT_COUNT} screenshots over size budget not saved" in result
+
+
+def test_put_deduplicates_and_evicts_least_recently_used(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=300)
+    first = store.put(b"a" * 100)
+    second = store.put(b"b" * 100)
+    assert store.put(b"a" * 100) == first
+    assert store.get(first) == b"a" * 100
+
+    store.put(b"c" * 100)
+    store.put(b"d" * 100)
+    assert store.get(second) is None
+    assert store.get(first) == b"a" * 100
+    assert sorted(os.listdir(tmp_path)) == sorted([first, store.put(b"c" * 100), store.put(b"d" * 100)])
+
+
+def test_artifact_larger_than_budget_is_skipped(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=100)
+    kept = store.put(b"y" * 50)
+    assert store.put(b"z" * 200) is None
+    assert store.total_bytes == 50
+    assert store.get(kept) == b"y" * 50
+
+
+def test_deleted_artifact_is_forgotten_and_rewritten(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    reference = store.put(b"a" * 100)
+    os.remove(tmp_path / reference)
+
+    assert store.get(reference) is None
+    assert store.total_bytes == 0
+
+    again = store.put(b"a" * 100)
+    os.remove(tmp_path / again)
+    assert store.put(b"a" * 100) == again
+    assert store.get(again) == b"a" * 100
+    assert store.total_bytes == 100
+
+
+def test_reopen_rebuilds_index_and_drops_partial_writes(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=300)
+    reference = store.put(b"a" * 100, "png")
+    (tmp_path / "deadbeef.png.tmp").write_bytes(b"partial")
+
+    reopened = ArtifactStore(str(tmp_path), max_bytes=300)
+    assert reopened.total_bytes == 100
+    assert reopened.get(reference) == b"a" * 100
+    assert not (tmp_path / "deadbeef.png.tmp").exists()
@@ -0,0 +1,76 @@
+from session_store import SessionStore
+
+
+def make_turn(i):
+    """One user turn that triggers a tool call, as logged by WebAgent"""
+    return [
+        {"role": "user", "content": f"request {i}"},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"id": f"call_{i}", "type": "function",
+                            "function": {"name": "get_current_status", "arguments": "{}"}}]
+        },
+        {"role": "tool", "tool_call_id": f"call_{i}", "content": f"result {i}"},
+        {"role": "assistant", "content": f"answer {i}"},
+    ]
+
+
+def test_resume_after_reopen(tmp_path):
+    db_path = str(tmp_path / "sessions.db")
+    store = SessionStore(db_path)
+    session_id = store.create_session()
+    store.append_messages(session_id, make_turn(0))
+    store.close()
+
+    reopened = SessionStore(db_path)
+    assert reopened.session_exists(session_id)
+    assert reopened.count_messages(session_id) == 4
+    messages, summary = reopened.load_recent(session_id, 20)
+    assert messages == make_turn(0)
+    assert summary is None
+
+
+def test_unknown_session(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    assert not store.session_exists("missing")
+    assert store.load_recent("missing", 20) == ([], None)
+
+
+def test_window_starting_after_tool_call_drops_orphaned_tool_result(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    session_id = store.create_session()
+    for i in range(3):
+        store.append_messages(session_id, make_turn(i))
+
+    # The last two messages of turn 1 are its tool result and answer; the tool result is orphaned
+    messages, summary = store.load_recent(session_id, 6)
+    assert messages[0] == {"role": "assistant", "content": "answer 1"}
+    assert messages[1:] == make_turn(2)
+    assert summary.startswith("Summary of 7 earlier messages")
+
+
+def test_summary_counts_and_requests(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    session_id = store.create_session()
+    for i in range(5):
+        store.append_messages(session_id, make_turn(i))
+
+    messages, summary = store.load_recent(session_id, 8)
+    assert messages == make_turn(3) + make_turn(4)
+    assert "Summary of 12 earlier messages" in summary
+    for i in range(3):
+        assert f"request {i}" in summary
+    assert "request 3" not in summary
+
+
+def test_sessions_are_isolated_and_clear(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    first = store.create_session()
+    second = store.create_session()
+    store.append_messages(first, make_turn(0))
+    store.append_messages(second, make_turn(1))
+
+    store.clear_session(first)
+    assert store.load_recent(first, 20) == ([], None)
+    assert store.load_recent(second, 20)[0] == make_turn(1)
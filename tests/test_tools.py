@@ -0,0 +1,65 @@
+import asyncio
+
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList
+from browser_use.browser.views import BrowserStateHistory
+
+from tools import WebTools
+
+
+def step(*results):
+    state = BrowserStateHistory(url="https://example.com", title="Example", tabs=[], interacted_element=[])
+    return AgentHistory(model_output=None, result=list(results), state=state)
+
+
+def run_task(web_tools):
+    return asyncio.run(web_tools.execute_web_task("Buy a book", ["Search", "Checkout"]))
+
+
+def test_unfinished_run_is_reported_incomplete(stub_browser_run, artifact_store):
+    stub_browser_run(lambda: AgentHistoryList(history=[step(ActionResult(extracted_content="Opened page"))]))
+    result = run_task(WebTools(artifact_store=artifact_store))
+    assert result.startswith("❌ TASK_INCOMPLETE")
+
+
+def test_run_without_final_result_is_reported_incomplete(stub_browser_run, artifact_store):
+    stub_browser_run(lambda: AgentHistoryList(history=[step(ActionResult())]))
+    result = run_task(WebTools(artifact_store=artifact_store))
+    assert result.startswith("❌ TASK_INCOMPLETE")
+    assert "No final result returned" in result
+
+
+def test_run_reported_failed_by_agent_is_incomplete(stub_browser_run, artifact_store):
+    stub_browser_run(lambda: AgentHistoryList(history=[
+        step(ActionResult(is_done=True, success=False, extracted_content="Out of stock"))
+    ]))
+    result = run_task(WebTools(artifact_store=artifact_store))
+    assert result.startswith("❌ TASK_INCOMPLETE")
+
+
+def test_successful_run_that_recovered_from_step_error(stub_browser_run, artifact_store):
+    stub_browser_run(lambda: AgentHistoryList(history=[
+        step(ActionResult(error="Element not found")),
+        step(ActionResult(is_done=True, success=True, extracted_content="Order placed")),
+    ]))
+    result = run_task(WebTools(artifact_store=artifact_store))
+    assert result.startswith("✅ Web task completed successfully")
+    assert "Order placed" in result
+    assert "Element not found" in result
+
+
+def test_retry_uses_run_outcome(stub_browser_run, artifact_store):
+    stub_browser_run(lambda: AgentHistoryList(history=[step(ActionResult(extracted_content="Opened page"))]))
+    web_tools = WebTools(artifact_store=artifact_store)
+    result = asyncio.run(web_tools.retry_web_task("Buy a book", "Use my saved card", ["Checkout"]))
+    assert result.startswith("❌ RETRY_FAILED")
+
+
+def test_result_references_saved_history(stub_browser_run, artifact_store):
+    stub_browser_run(lambda: AgentHistoryList(history=[
+        step(ActionResult(is_done=True, success=True, extracted_content="Order placed"))
+    ]))
+    result = run_task(WebTools(artifact_store=artifact_store))
+
+    reference = result.split("history ")[1].split()[0]
+    assert reference.endswith(".json")
+    assert b"Order placed" in artifact_store.get(reference)
@@ -0,0 +1,72 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from config import SESSION_HISTORY_WINDOW
+
+
+def test_unknown_session_id_is_rejected(make_agent):
+    with pytest.raises(ValueError, match="Unknown session ID"):
+        make_agent(session_id="missing")
+
+
+def test_history_is_unloaded_after_each_turn(make_agent, session_store):
+    agent = make_agent(reply="Hello!")
+    assert asyncio.run(agent.process_user_input("hi")) == "Hello!"
+
+    assert agent.conversation_history == []
+    assert agent.history_summary is None
+    assert session_store.count_messages(agent.session_id) == 2
+
+
+def test_get_conversation_history_does_not_keep_window_resident(make_agent):
+    agent = make_agent(reply="Hello!")
+    asyncio.run(agent.process_user_input("hi"))
+
+    history = agent.get_conversation_history()
+    assert history == [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "Hello!"}]
+    assert agent.conversation_history == []
+
+
+def test_resumed_agent_reloads_window_and_summary(make_agent):
+    agent = make_agent(reply="Noted.")
+    turns = SESSION_HISTORY_WINDOW // 2 + 2
+    for i in range(turns):
+        asyncio.run(agent.process_user_input(f"request {i}"))
+
+    resumed = make_agent(session_id=agent.session_id, reply="Welcome back.")
+    assert resumed.resumed
+    asyncio.run(resumed.process_user_input("continue"))
+
+    sent = resumed.openai_client.last_messages
+    assert sent[1]["role"] == "system"
+    assert sent[1]["content"].startswith(f"Summary of {2 * turns - SESSION_HISTORY_WINDOW} earlier messages")
+    assert "request 0" in sent[1]["content"]
+    assert len(sent) == 2 + SESSION_HISTORY_WINDOW + 1
+    assert sent[-1] == {"role": "user", "content": "continue"}
+
+
+def test_failed_openai_call_logs_user_message_and_error_reply(make_agent):
+    agent = make_agent(error=RuntimeError("api down"))
+    reply = asyncio.run(agent.process_user_input("hi"))
+
+    assert reply == "❌ Error processing request: api down"
+    assert agent.conversation_history == []
+    assert agent.get_conversation_history() == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": reply},
+    ]
+
+
+def test_store_failure_reports_original_error(make_agent, session_store, monkeypatch):
+    agent = make_agent()
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(session_store, "append_messages", locked)
+    reply = asyncio.run(agent.process_user_input("hi"))
+
+    assert reply == "❌ Error processing request: database is locked"
+    assert agent.conversation_history == []
@@ -4,18 +4,23 @@ Tools module for Browser-Use Agent
 Contains tool definitions and execution functions for OpenAI function calling.
 """
 
+import base64
+import json
 from typing import Dict, List, Any, Optional
 from browser_use import Agent, BrowserSession
 from browser_use.llm.openai.chat import ChatOpenAI
-from config import BROWSER_MODEL
+from artifact_store import ArtifactStore, get_default_store
+from config import BROWSER_MODEL, ARTIFACT_INLINE_MAX_CHARS
 
 
 class WebTools:
     """Tools for web automation and agent functionality"""
     
-    def __init__(self, browser_session: Optional[BrowserSession] = None):
+    def __init__(self, browser_session: Optional[BrowserSession] = None,
+                 artifact_store: Optional[ArtifactStore] = None):
         self.browser_llm = ChatOpenAI(model=BROWSER_MODEL)
         self.browser_session = browser_session
+        self.artifact_store = artifact_store or get_default_store()
     
     async def analyze_task_requirements(self, task_description: str) -> str:
         """
@@ -215,11 +220,11 @@ Task Analysis Complete:
             agent = Agent(task=detailed_task, llm=self.browser_llm, use_vision=True, browser_session=self.browser_session)
             result = await agent.run()
             
-            # Convert result to string for processing
-            result_str = str(result) if result else ""
+            # Spill the run history to disk and keep only a compact summary
+            result_str = self._summarize_history(result)
             
-            # Check if the result indicates failure or incomplete task
-            if result_str and self._is_task_unsuccessful(result_str):
+            # Check if the run ended without completing the task
+            if self._is_run_unsuccessful(result):
                 return f"❌ TASK_INCOMPLETE: {result_str}\n\nThe task could not be completed successfully. This might be due to:\n• Missing or incorrect information\n• Authentication issues\n• Website unavailable or changed\n• Payment or account setup required\n• Insufficient permissions\n\nPlease provide additional information or clarify the requirements to help complete this task."
             
             return f"✅ Web task completed successfully. Result: {result_str}"
@@ -238,25 +243,73 @@ Task Analysis Complete:
             else:
                 return f"❌ EXECUTION_ERROR: {error_msg}\n\nThe task encountered an error. Please:\n• Verify all provided information is correct\n• Check if additional details are needed\n• Try rephrasing the task requirements"
     
-    def _is_task_unsuccessful(self, result: str) -> bool:
+    def _summarize_history(self, history: Any) -> str:
         """
-        Check if the task result indicates failure or incomplete execution
+        Build a compact summary of a browser-use run and spill its artifacts to disk
         
         Args:
-            result: The result string from browser-use execution
+            history: The AgentHistoryList returned by browser-use
             
         Returns:
-            True if the task appears to be unsuccessful
+            Final result, step count, most recent errors and references to the stored artifacts
         """
-        failure_indicators = [
-            "failed", "error", "unable", "cannot", "could not", "unsuccessful",
-            "not found", "access denied", "permission denied", "login required",
-            "authentication required", "timeout", "connection failed",
-            "page not found", "server error", "unavailable"
-        ]
+        if history is None:
+            return ""
+        
+        final_result = history.final_result() or "No final result returned"
+        if len(final_result) > ARTIFACT_INLINE_MAX_CHARS:
+            final_result = f"{final_result[:ARTIFACT_INLINE_MAX_CHARS]}... [truncated]"
+        
+        summary = f"{final_result}\n\nSteps taken: {history.number_of_steps()}"
+        errors = [error for error in history.errors() if error]
+        if errors:
+            summary += f"\nStep errors:\n{chr(10).join(f'   • {error[:200]}' for error in errors[-3:])}"
+        
+        return f"{summary}\n{self._save_artifacts(history)}"
+    
+    def _save_artifacts(self, history: Any) -> str:
+        """
+        Write the full run history and screenshots to the artifact store
+        
+        A failure here never fails the task itself; the artifacts are only kept for inspection.
+        
+        Args:
+            history: The AgentHistoryList returned by browser-use
+            
+        Returns:
+            One line referencing the stored artifacts
+        """
+        try:
+            history_ref = self.artifact_store.put(json.dumps(history.model_dump(), default=str).encode(), "json")
+            screenshot_refs = [
+                self.artifact_store.put(base64.b64decode(screenshot), "png")
+                for screenshot in history.screenshots() if screenshot
+            ]
+        except Exception as e:
+            print(f"⚠️ Warning: Run artifacts not saved: {str(e)}")
+            return "Artifacts: not saved"
         
-        result_lower = result.lower()
-        return any(indicator in result_lower for indicator in failure_indicators)
+        saved_screenshots = [ref for ref in screenshot_refs if ref]
+        artifacts = f"Artifacts in {self.artifact_store.artifact_dir}: history {history_ref or 'not saved (over size budget)'}"
+        if saved_screenshots:
+            artifacts += f", screenshots {', '.join(saved_screenshots)}"
+        if len(saved_screenshots) < len(screenshot_refs):
+            artifacts += f" ({len(screenshot_refs) - len(saved_screenshots)} screenshots over size budget not saved)"
+        
+        print(f"💾 {artifacts}")
+        return artifacts
+    
+    def _is_run_unsuccessful(self, history: Any) -> bool:
+        """
+        Check if a browser-use run ended without completing its task
+        
+        Args:
+            history: The AgentHistoryList returned by browser-use
+            
+        Returns:
+            True if the agent never finished or reported the task as failed
+        """
+        return history is None or not history.is_done() or history.is_successful() is False
     
     async def retry_web_task(self, original_task_description: str, additional_information: str, task_steps: List[str]) -> str:
         """
@@ -292,11 +345,11 @@ Please use the additional information to successfully complete the original task
             agent = Agent(task=enhanced_task, llm=self.browser_llm, use_vision=True, browser_session=self.browser_session)
             result = await agent.run()
             
-            # Convert result to string for processing
-            result_str = str(result) if result else ""
+            # Spill the run history to disk and keep only a compact summary
+            result_str = self._summarize_history(result)
             
             # Check if the retry was successful
-            if result_str and self._is_task_unsuccessful(result_str):
+            if self._is_run_unsuccessful(result):
                 return f"❌ RETRY_FAILED: {result_str}\n\nThe task retry was unsuccessful. The additional information provided may not have resolved the issue, or there may be other problems:\n• The website may have changed or be unavailable\n• Additional authentication or permissions may be required\n• The provided information may be incorrect or incomplete\n• Technical issues with the website\n\nPlease try providing different information or approach the task differently."
             
             return f"✅ Task retry successful! Result: {result_str}"
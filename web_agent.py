@@ -5,21 +5,34 @@ Handles conversation flow, OpenAI integration, and orchestrates tool execution.
 """
 
 import json
+import sqlite3
 from typing import List, Dict, Any, Optional
 import openai
 from tools import WebTools
-from config import OPENAI_API_KEY, OPENAI_MODEL, ERROR_NO_API_KEY, ERROR_PROCESSING
+from session_store import SessionStore, get_default_store
+from config import (OPENAI_API_KEY, OPENAI_MODEL, ERROR_NO_API_KEY, ERROR_PROCESSING,
+                    ERROR_UNKNOWN_SESSION, SESSION_HISTORY_WINDOW)
 from browser_use import BrowserSession
 
 
 class WebAgent:
     """Main agent class that orchestrates web automation tasks"""
     
-    def __init__(self, browser_session: Optional[BrowserSession] = None):
+    def __init__(self, browser_session: Optional[BrowserSession] = None,
+                 session_id: Optional[str] = None,
+                 session_store: Optional[SessionStore] = None):
         if not OPENAI_API_KEY:
             raise ValueError(ERROR_NO_API_KEY)
             
+        self.session_store = session_store or get_default_store()
+        if session_id is not None and not self.session_store.session_exists(session_id):
+            raise ValueError(ERROR_UNKNOWN_SESSION.format(session_id))
+            
+        self.resumed = session_id is not None
+        self.session_id = self.session_store.create_session(session_id)
         self.conversation_history: List[Dict[str, Any]] = []
+        self.history_summary: Optional[str] = None
+        self._history_loaded = False
         self.openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
         self.tools = WebTools(browser_session=browser_session)
         self.browser_session = browser_session
@@ -59,16 +72,44 @@ class WebAgent:
             Always ask for clarification if information is incomplete. Never proceed with missing details."""
         }
     
+    def _load_history(self):
+        """Load the recent window of this session from the store if not resident"""
+        if not self._history_loaded:
+            self.conversation_history, self.history_summary = self.session_store.load_recent(
+                self.session_id, SESSION_HISTORY_WINDOW
+            )
+            self._history_loaded = True
+    
+    def _append_messages(self, *messages: Dict[str, Any]):
+        """Log messages to the session store and add them to the in-memory history"""
+        self.session_store.append_messages(self.session_id, list(messages))
+        self.conversation_history.extend(messages)
+    
+    def _build_messages(self) -> List[Dict[str, Any]]:
+        """Build the message list for OpenAI from the system message, summary and recent history"""
+        messages: List[Dict[str, Any]] = [self.get_system_message()]
+        if self.history_summary:
+            messages.append({"role": "system", "content": self.history_summary})
+        return messages + self.conversation_history
+    
+    def unload_history(self):
+        """Drop the in-memory history of an idle session; it is reloaded lazily from the store"""
+        self.conversation_history = []
+        self.history_summary = None
+        self._history_loaded = False
+    
     async def process_user_input(self, user_input: str) -> str:
         """Process user input using OpenAI function calling"""
         
-        # Add user message to conversation history
-        self.conversation_history.append({"role": "user", "content": user_input})
-        
-        # Prepare messages for OpenAI
-        messages = [self.get_system_message()] + self.conversation_history
-        
         try:
+            self._load_history()
+            
+            # Add user message to conversation history
+            self._append_messages({"role": "user", "content": user_input})
+            
+            # Prepare messages for OpenAI
+            messages = self._build_messages()
+            
             # Make OpenAI API call with tool calling
             response = self.openai_client.chat.completions.create(
                 model=OPENAI_MODEL,
@@ -88,8 +129,8 @@ class WebAgent:
                 # Execute the tool
                 result = await self.tools.execute_tool(function_name, function_args)
                 
-                # Add tool call to conversation
-                self.conversation_history.append({
+                # Add tool call and its result to conversation
+                self._append_messages({
                     "role": "assistant",
                     "content": None,
                     "tool_calls": [
@@ -102,9 +143,7 @@ class WebAgent:
                             }
                         }
                     ]
-                })
-                
-                self.conversation_history.append({
+                }, {
                     "role": "tool",
                     "tool_call_id": tool_call.id,
                     "content": result
@@ -115,29 +154,41 @@ class WebAgent:
                 # For other functions, get final response from the model
                 final_response = self.openai_client.chat.completions.create(
                     model=OPENAI_MODEL,
-                    messages=[self.get_system_message()] + self.conversation_history  # type: ignore
+                    messages=self._build_messages()  # type: ignore
                 )
                 
                 final_message = final_response.choices[0].message.content or "Task completed."
-                self.conversation_history.append({"role": "assistant", "content": final_message})
+                self._append_messages({"role": "assistant", "content": final_message})
                 
                 return final_message
             
             else:
                 # No tool call needed, just return the response
                 response_content = message.content or "I'm ready to help with web tasks."
-                self.conversation_history.append({"role": "assistant", "content": response_content})
+                self._append_messages({"role": "assistant", "content": response_content})
                 return response_content
                 
         except Exception as e:
             error_msg = ERROR_PROCESSING.format(str(e))
-            self.conversation_history.append({"role": "assistant", "content": error_msg})
+            try:
+                self._append_messages({"role": "assistant", "content": error_msg})
+            except sqlite3.Error:
+                # The store itself may be what failed; report the original error anyway
+                pass
             return error_msg
+        
+        finally:
+            # Idle sessions keep nothing resident; the next turn reloads from the store
+            self.unload_history()
     
     def clear_conversation(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.session_store.clear_session(self.session_id)
+        self.unload_history()
     
     def get_conversation_history(self) -> List[Dict[str, Any]]:
-        """Get the current conversation history"""
-        return self.conversation_history.copy() 
\ No newline at end of file
+        """Get the recent window of the conversation history without keeping it resident"""
+        if self._history_loaded:
+            return self.conversation_history.copy()
+        history, _ = self.session_store.load_recent(self.session_id, SESSION_HISTORY_WINDOW)
+        return history
\ No newline at end of file